@@ -2,7 +2,7 @@
 docu - Generate documentation from Python files using #/ comments.
 """
 
-from .docgen import process_file
+from .docgen import process_file, process_files
 from .models import DocItem, ArgumentInfo
 from .doc_parsers import get_parser
 from .template_manager import TemplateManager
@@ -11,6 +11,7 @@ __version__ = '0.1.0'
 
 __all__ = [
     'process_file',
+    'process_files',
     'DocItem',
     'ArgumentInfo',
     'get_parser',
@@ -1,24 +1,58 @@
 """AST utilities for parsing Python code."""
 
 import ast
-from typing import Optional
-
-def get_type_str(node: ast.AST) -> str:
-    """Convert AST type annotation to string representation."""
-    if isinstance(node, ast.Name):
-        return node.id
-    elif isinstance(node, ast.Subscript):
-        value = get_type_str(node.value)
-        slice_val = get_type_str(node.slice)
-        return f"{value}[{slice_val}]"
-    elif isinstance(node, ast.Attribute):
-        return f"{get_type_str(node.value)}.{node.attr}"
-    elif isinstance(node, ast.Constant):
-        return str(node.value)
-    elif isinstance(node, ast.List):
-        elts = [get_type_str(elt) for elt in node.elts]
-        return f"[{', '.join(elts)}]"
-    elif isinstance(node, ast.Tuple):
-        elts = [get_type_str(elt) for elt in node.elts]
-        return f"({', '.join(elts)})"
-    return "Any"
\ No newline at end of file
+from typing import Dict, Optional
+
+
+def _subscript_str(node: ast.Subscript, memo) -> str:
+    return f"{get_type_str(node.value, memo)}[{get_type_str(node.slice, memo)}]"
+
+
+def _list_str(node: ast.List, memo) -> str:
+    return f"[{', '.join(get_type_str(elt, memo) for elt in node.elts)}]"
+
+
+def _tuple_str(node: ast.Tuple, memo) -> str:
+    return f"({', '.join(get_type_str(elt, memo) for elt in node.elts)})"
+
+
+# Handler table keyed on the concrete node type so each visit is a single
+# dict lookup instead of an isinstance ladder.
+_HANDLERS = {
+    ast.Name: lambda node, memo: node.id,
+    ast.Attribute: lambda node, memo: f"{get_type_str(node.value, memo)}.{node.attr}",
+    ast.Constant: lambda node, memo: str(node.value),
+    ast.Subscript: _subscript_str,
+    ast.List: _list_str,
+    ast.Tuple: _tuple_str,
+}
+
+
+def get_type_str(node: ast.AST, _memo: Optional[Dict[int, str]] = None) -> str:
+    """Convert AST type annotation to string representation.
+
+    Args:
+        node: Annotation node to stringify
+        _memo: Optional per-file memo keyed by node id; pass a fresh dict
+            per parsed file to skip re-stringifying shared subtrees
+
+    Returns:
+        String representation of the annotation
+    """
+    if _memo is not None:
+        cached = _memo.get(id(node))
+        if cached is not None:
+            return cached
+    handler = _HANDLERS.get(type(node))
+    if handler is not None:
+        result = handler(node, _memo)
+    else:
+        # Fall back to ast.unparse (3.9+) so annotation shapes without a
+        # dedicated handler (unions, Callable, ...) still render
+        try:
+            result = ast.unparse(node)
+        except Exception:
+            result = "Any"
+    if _memo is not None:
+        _memo[id(node)] = result
+    return result
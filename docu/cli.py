@@ -1,9 +1,10 @@
 """Command line interface for docu."""
 import sys
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from .docgen import process_file
-from .watcher import watch_files, run_livereload_server, watch_and_serve
 import os
 
 def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
@@ -72,6 +73,26 @@ def parse_args(args: Optional[List[str]] = None) -> argparse.Namespace:
     
     return parser.parse_args(args)
 
+def _validate_input_file(file_path: str, additional: bool = False) -> Optional[str]:
+    """Validate one input path with a single stat call.
+
+    Args:
+        file_path: Path to validate
+        additional: Whether the path came from --files (changes the message)
+
+    Returns:
+        An error message, or None if the path is a readable Python file
+    """
+    try:
+        os.stat(file_path)
+    except OSError:
+        if additional:
+            return f"Error: Additional file not found: {file_path}"
+        return f"Error: File not found: {file_path}"
+    if not file_path.endswith('.py'):
+        return f"Error: {file_path} must be a Python (.py) file"
+    return None
+
 def main(args: Optional[List[str]] = None) -> int:
     """Main entry point for the CLI.
     Args:
@@ -81,16 +102,12 @@ def main(args: Optional[List[str]] = None) -> int:
     """
     parsed_args = parse_args(args)
     
-    # Check if file exists
-    if not os.path.exists(parsed_args.file_path):
-        print(f"Error: File not found: {parsed_args.file_path}", file=sys.stderr)
+    # Validate the main file (one stat per path, errors reported together)
+    error = _validate_input_file(parsed_args.file_path)
+    if error:
+        print(error, file=sys.stderr)
         return 1
-    
-    # Check if it's a Python file
-    if not parsed_args.file_path.endswith('.py'):
-        print(f"Error: {parsed_args.file_path} must be a Python (.py) file", file=sys.stderr)
-        return 1
-    
+
     # For live preview server, output_dir is required
     if parsed_args.serve and not parsed_args.output_dir:
         print("Error: --output-dir is required when using --serve", file=sys.stderr)
@@ -105,17 +122,25 @@ def main(args: Optional[List[str]] = None) -> int:
     # Collect all files to process
     files_to_process = [parsed_args.file_path]
     if parsed_args.files:
-        # Validate additional files
+        # Validate additional files, reporting every bad path at once
+        errors = []
         for file_path in parsed_args.files:
-            if not os.path.exists(file_path):
-                print(f"Error: Additional file not found: {file_path}", file=sys.stderr)
-                return 1
-            if not file_path.endswith('.py'):
-                print(f"Error: {file_path} must be a Python (.py) file", file=sys.stderr)
-                return 1
-            files_to_process.append(file_path)
+            error = _validate_input_file(file_path, additional=True)
+            if error:
+                errors.append(error)
+            else:
+                files_to_process.append(file_path)
+        if errors:
+            for error in errors:
+                print(error, file=sys.stderr)
+            return 1
     
     try:
+        if parsed_args.watch or parsed_args.serve:
+            # Deferred so a one-shot run never pays the watchdog/livereload
+            # import cost
+            from .watcher import watch_files, watch_and_serve
+
         if parsed_args.serve:
             # Start watch mode with live preview server
             if parsed_args.verbose:
@@ -141,19 +166,30 @@ def main(args: Optional[List[str]] = None) -> int:
             if parsed_args.verbose:
                 print("Starting watch mode...")
                 
-            # First generate the initial documentation
-            for file_path in files_to_process:
-                output = process_file(
-                    file_path,
-                    output_format=parsed_args.format,
-                    output_dir=parsed_args.output_dir,
-                    template_name=parsed_args.template,
-                    doc_style=parsed_args.doc_style
+            # First generate the initial documentation. The per-file work is
+            # I/O-bound, so a small thread pool overlaps the reads and writes
+            # when several --files are watched.
+            if parsed_args.output_dir:
+                os.makedirs(parsed_args.output_dir, exist_ok=True)
+
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(files_to_process))
+            ) as executor:
+                outputs = executor.map(
+                    lambda path: process_file(
+                        path,
+                        output_format=parsed_args.format,
+                        output_dir=parsed_args.output_dir,
+                        template_name=parsed_args.template,
+                        doc_style=parsed_args.doc_style
+                    ),
+                    files_to_process
                 )
-                if parsed_args.output_dir:
-                    print(f"Documentation saved to: {output}")
-                else:
-                    print(output)
+                for output in outputs:
+                    if parsed_args.output_dir:
+                        print(f"Documentation saved to: {output}")
+                    else:
+                        print(output)
             
             # Then watch for changes
             observer = watch_files(
@@ -167,10 +203,8 @@ def main(args: Optional[List[str]] = None) -> int:
             
             try:
                 print("Watching for file changes. Press Ctrl+C to stop...")
-                while True:
-                    # Keep the program running
-                    import time
-                    time.sleep(1)
+                # Block without periodic wakeups; Ctrl+C interrupts the wait
+                threading.Event().wait()
             except KeyboardInterrupt:
                 observer.stop()
             observer.join()
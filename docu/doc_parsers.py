@@ -1,14 +1,12 @@
 """Documentation style parsers for docu."""
 import re
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict
 
-@dataclass
-class DocPart:
-    """Represents a part of parsed documentation."""
-    name: str
-    content: str
-    type: Optional[str] = None
+# Section-header recognizers, compiled once at module load so the per-line
+# parse loops only pay a single match call instead of repeated
+# .lower()/equality checks.
+_GOOGLE_SECTION_RE = re.compile(r'(args|returns|raises):\s*$', re.I)
+_NUMPY_HEADERS = frozenset({'parameters', 'returns', 'raises'})
 
 class DocStyleParser:
     """Base class for documentation style parsers."""
@@ -34,28 +32,23 @@ class GoogleStyleParser(DocStyleParser):
         current_section = 'description'
         indent_level = None
         description_lines = []
+        returns_lines = []
         current_indent = 0
-        
-        lines = [line.rstrip() for line in docstring.splitlines()]
-        
-        # Find the first non-empty line to determine base indentation
-        for line in lines:
-            if line.strip():
-                indent_level = len(line) - len(line.lstrip())
-                break
-        
-        if indent_level is None:
-            return sections
-            
-        # Process lines with proper indentation handling
-        for line in lines:
+
+        # Single pass: base indentation is discovered on the first
+        # non-blank line and that same line is processed immediately
+        for line in docstring.splitlines():
+            line = line.rstrip()
             stripped = line.strip()
             if not stripped:
                 if current_section == 'description':
                     description_lines.append('')
                 continue
-                
+
             line_indent = len(line) - len(line.lstrip())
+            if indent_level is None:
+                indent_level = line_indent
+
             # Remove base indentation
             if line_indent > indent_level:
                 line = line[indent_level:]
@@ -63,19 +56,13 @@ class GoogleStyleParser(DocStyleParser):
             else:
                 line = line.lstrip()
                 current_indent = 0
-            
+
             # Check for section headers
-            lower_stripped = stripped.lower()
-            if lower_stripped == 'args:':
-                current_section = 'args'
+            header = _GOOGLE_SECTION_RE.fullmatch(stripped)
+            if header:
+                current_section = header.group(1).lower()
                 continue
-            elif lower_stripped == 'returns:':
-                current_section = 'returns'
-                continue
-            elif lower_stripped == 'raises:':
-                current_section = 'raises'
-                continue
-                
+
             # Add content to current section
             if current_section == 'description':
                 description_lines.append(line)
@@ -85,13 +72,13 @@ class GoogleStyleParser(DocStyleParser):
                     sections['args'].append(stripped)
             elif current_section == 'returns':
                 if current_indent > 0:
-                    sections['returns'] += stripped + '\n'
+                    returns_lines.append(stripped)
             elif current_section == 'raises':
                 if current_indent > 0:
                     sections['raises'].append(stripped)
-        
+
         sections['description'] = '\n'.join(description_lines).strip()
-        sections['returns'] = sections['returns'].strip()
+        sections['returns'] = '\n'.join(returns_lines)
         return sections
 
 class NumpyStyleParser(DocStyleParser):
@@ -103,31 +90,31 @@ class NumpyStyleParser(DocStyleParser):
             
         sections = {'description': '', 'parameters': [], 'returns': '', 'raises': []}
         current_section = 'description'
-        lines = docstring.split('\n')
-        
-        for line in lines:
+        description_lines = []
+        returns_lines = []
+
+        for line in docstring.split('\n'):
             line = line.strip()
-            
-            # Check for section headers
-            if line.lower() == 'parameters':
-                current_section = 'parameters'
-                continue
-            elif line.lower() == 'returns':
-                current_section = 'returns'
-                continue
-            elif line.lower() == 'raises':
-                current_section = 'raises'
+
+            # Check for section headers: one .lower() and one hash lookup
+            lowered = line.lower()
+            if lowered in _NUMPY_HEADERS:
+                current_section = lowered
                 continue
-                
+
             # Add content to current section
             if current_section == 'description':
-                sections['description'] += line + '\n'
+                description_lines.append(line)
             elif current_section in ('parameters', 'raises') and line:
                 if ':' in line:
-                    sections[current_section].append(line.strip())
+                    sections[current_section].append(line)
             elif current_section == 'returns' and line:
-                sections['returns'] += line + '\n'
-                
+                returns_lines.append(line)
+
+        if description_lines:
+            sections['description'] = '\n'.join(description_lines) + '\n'
+        if returns_lines:
+            sections['returns'] = '\n'.join(returns_lines) + '\n'
         return sections
 
 class SphinxStyleParser(DocStyleParser):
@@ -139,26 +126,47 @@ class SphinxStyleParser(DocStyleParser):
             
         sections = {'description': '', 'params': [], 'returns': '', 'raises': []}
         current_section = 'description'
-        lines = docstring.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            
+        description_lines = []
+        returns_lines = []
+
+        for line in docstring.split('\n'):
+            line = line.lstrip()
+
+            # Fast path: a line that does not start with ':' cannot be a
+            # directive, so skip the prefix dispatch entirely
+            if not line.startswith(':'):
+                if current_section == 'description':
+                    description_lines.append(line.rstrip())
+                continue
+
+            line = line.rstrip()
+
             # Check for Sphinx directives
             if line.startswith(':param'):
                 current_section = 'params'
                 sections['params'].append(line[6:].strip())
             elif line.startswith(':returns:'):
                 current_section = 'returns'
-                sections['returns'] += line[9:].strip() + '\n'
+                returns_lines.append(line[9:].strip())
             elif line.startswith(':raises:'):
                 current_section = 'raises'
                 sections['raises'].append(line[8:].strip())
             elif current_section == 'description':
-                sections['description'] += line + '\n'
-                
+                description_lines.append(line)
+
+        if description_lines:
+            sections['description'] = '\n'.join(description_lines) + '\n'
+        if returns_lines:
+            sections['returns'] = '\n'.join(returns_lines) + '\n'
         return sections
 
+# The parsers are stateless, so one shared instance per style suffices
+_PARSERS = {
+    'google': GoogleStyleParser(),
+    'numpy': NumpyStyleParser(),
+    'sphinx': SphinxStyleParser()
+}
+
 def get_parser(style: str = 'google') -> DocStyleParser:
     """Get a documentation style parser.
     
@@ -171,13 +179,8 @@ def get_parser(style: str = 'google') -> DocStyleParser:
     Raises:
         ValueError: If style is not supported
     """
-    parsers = {
-        'google': GoogleStyleParser,
-        'numpy': NumpyStyleParser,
-        'sphinx': SphinxStyleParser
-    }
-    
-    if style not in parsers:
+    parser = _PARSERS.get(style)
+    if parser is None:
         raise ValueError(f"Unsupported documentation style: {style}")
-        
-    return parsers[style]()
\ No newline at end of file
+
+    return parser
\ No newline at end of file
@@ -5,12 +5,29 @@ This module contains the logic for parsing Python files and extracting
 documentation from #/ comments, similar to Rust's cargo doc.
 """
 
+import hashlib
 import os
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import List, Optional
 
 from .parsers import parse_python_file
 from .generators import generate_markdown_docs, generate_html_docs
 
+# Output directories already created this process, so watch-mode rebuilds
+# skip the repeated makedirs syscall
+_created_dirs = set()
+
+# Generated content keyed by (path, format, template, doc_style) with the
+# source stat signature stored in the value, so watch and serve rebuilds
+# skip unchanged files while each save replaces the stale entry instead of
+# accumulating one per mtime
+_content_cache = {}
+
+# Digest of what was last written to each output path, so identical
+# regenerations skip the disk write
+_written_digests = {}
+
 
 def process_file(
     file_path: str,
@@ -31,30 +48,85 @@ def process_file(
     Returns:
         Generated documentation content
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
-    
-    doc_items = parse_python_file(file_path)
-    
+    # One stat both validates the path and keys the content cache
+    stat = os.stat(file_path)
+    stat_sig = (stat.st_mtime_ns, stat.st_size)
+    cache_key = (file_path, output_format, template_name, doc_style)
+    cached = _content_cache.get(cache_key)
+    content = cached[1] if cached is not None and cached[0] == stat_sig else None
+
+    # Strip only the trailing '.py' (not every occurrence, which broke
+    # names like my.pyutils.py) with an O(1) suffix check
+    base_name = os.path.basename(file_path)
+    if base_name.endswith('.py'):
+        base_name = base_name[:-3]
+
     if output_format == 'markdown':
-        content = generate_markdown_docs(doc_items)
-        extension = 'md'
-        # For markdown, use original naming
-        output_filename = os.path.basename(file_path).replace('.py', f'.{extension}')
+        output_filename = f"{base_name}.md"
+        if content is None:
+            content = generate_markdown_docs(parse_python_file(file_path))
     else:  # html
-        content = generate_html_docs(doc_items, template_name, doc_style)
-        extension = 'html'
         # For HTML, include template name in the filename
-        base_name = os.path.basename(file_path).replace('.py', '')
-        output_filename = f"{base_name}_{template_name}.{extension}"
-    
+        output_filename = f"{base_name}_{template_name}.html"
+        if content is None:
+            content = generate_html_docs(
+                parse_python_file(file_path), template_name, doc_style
+            )
+
+    _content_cache[cache_key] = (stat_sig, content)
+
     if output_dir:
-        os.makedirs(output_dir, exist_ok=True)
+        if output_dir not in _created_dirs:
+            os.makedirs(output_dir, exist_ok=True)
+            _created_dirs.add(output_dir)
         output_path = os.path.join(output_dir, output_filename)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-        
+
+        # Skip the disk write when this exact content is already on disk
+        data = content.encode('utf-8')
+        digest = hashlib.blake2b(data).digest()
+        if _written_digests.get(output_path) != digest or not os.path.exists(output_path):
+            # Binary write skips the TextIOWrapper layer for large HTML output
+            with open(output_path, 'wb') as f:
+                f.write(data)
+            _written_digests[output_path] = digest
+
         return output_path
-    
-    return content
\ No newline at end of file
+
+    return content
+
+def process_files(
+    file_paths: List[str],
+    output_format: str = 'markdown',
+    output_dir: Optional[str] = None,
+    template_name: str = 'default',
+    doc_style: str = 'google',
+    max_workers: Optional[int] = None
+) -> List[str]:
+    """Process several Python files in parallel worker processes.
+
+    Parsing and rendering are CPU-bound and independent per file, so a
+    process pool scales with core count where threads would serialize on
+    the GIL.
+
+    Args:
+        file_paths: Paths of the Python files to process
+        output_format: Format of the output ('markdown' or 'html')
+        output_dir: Directory to save the output files (if None, returns content)
+        template_name: Name of the template to use for HTML output
+        doc_style: Documentation style to parse ('google', 'numpy', or 'sphinx')
+        max_workers: Worker process count (defaults to the executor's choice)
+
+    Returns:
+        Per-file results in input order: output paths if output_dir is
+        given, otherwise the generated content
+    """
+    worker = partial(
+        process_file,
+        output_format=output_format,
+        output_dir=output_dir,
+        template_name=template_name,
+        doc_style=doc_style
+    )
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # chunksize amortizes IPC overhead across small files
+        return list(executor.map(worker, file_paths, chunksize=8))
@@ -1,34 +1,134 @@
 """Data models for documentation generation."""
 
-from dataclasses import dataclass
+import sys
 from typing import Dict, List, Optional
 
 
-@dataclass
 class ArgumentInfo:
     """Information about a function/method argument."""
-    name: str
-    type_hint: Optional[str] = None
-    default: Optional[str] = None
+
+    __slots__ = ('name', 'type_hint', 'default')
+
+    def __init__(
+        self,
+        name: str,
+        type_hint: Optional[str] = None,
+        default: Optional[str] = None,
+    ):
+        self.name = name
+        # Type hints repeat heavily across a codebase; interning makes
+        # them shared and comparisons pointer-fast
+        self.type_hint = sys.intern(type_hint) if type_hint else type_hint
+        self.default = default
+
+    def __repr__(self) -> str:
+        return (
+            f"ArgumentInfo(name={self.name!r}, type_hint={self.type_hint!r}, "
+            f"default={self.default!r})"
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ArgumentInfo):
+            return NotImplemented
+        return (
+            self.name == other.name
+            and self.type_hint == other.type_hint
+            and self.default == other.default
+        )
+
+
+class ParsedModule:
+    """Doc items of one module plus indexes the generators consume.
+
+    Built in a single pass over the items so downstream renderers never
+    re-filter the dict by type or parent.
+    """
+
+    __slots__ = ('items', 'classes', 'functions', 'methods_by_parent', 'module')
+
+    def __init__(
+        self,
+        items: Dict[str, 'DocItem'],
+        classes: List['DocItem'],
+        functions: List['DocItem'],
+        methods_by_parent: Dict[str, List['DocItem']],
+        module: Optional['DocItem'],
+    ):
+        self.items = items
+        self.classes = classes
+        self.functions = functions
+        self.methods_by_parent = methods_by_parent
+        self.module = module
+
+    @classmethod
+    def from_doc_items(cls, doc_items: Dict[str, 'DocItem']) -> 'ParsedModule':
+        """Bucket a doc-items dict by type and parent in one pass."""
+        classes: List['DocItem'] = []
+        functions: List['DocItem'] = []
+        methods_by_parent: Dict[str, List['DocItem']] = {}
+        module: Optional['DocItem'] = None
+        for item in doc_items.values():
+            if item.item_type == 'class':
+                classes.append(item)
+            elif item.item_type == 'function':
+                if not item.parent:
+                    functions.append(item)
+            elif item.item_type == 'method':
+                methods_by_parent.setdefault(item.parent, []).append(item)
+            elif item.item_type == 'module' and module is None:
+                module = item
+        return cls(doc_items, classes, functions, methods_by_parent, module)
 
 
-@dataclass
 class DocItem:
-    """Represents a documented item in the Python code."""
-    name: str
-    doc: str
-    item_type: str  # 'class', 'function', 'method', 'module', etc.
-    lineno: int
-    parent: Optional[str] = None
-    args: List[ArgumentInfo] = None
-    return_type: Optional[str] = None
-    fields: Dict[str, str] = None  # For classes, mapping of field name to type
-    methods: List['DocItem'] = None  # For classes, list of method DocItems
-
-    def __post_init__(self):
-        if self.args is None:
-            self.args = []
-        if self.fields is None:
-            self.fields = {}
-        if self.methods is None:
-            self.methods = []
+    """Represents a documented item in the Python code.
+
+    Instances are created once per documented symbol, so __slots__ is used
+    instead of a dataclass: no per-instance __dict__, smaller objects, and
+    faster attribute access on large repositories.
+    """
+
+    __slots__ = (
+        'name', 'doc', 'item_type', 'lineno', 'parent', 'args',
+        'return_type', 'fields', 'methods', 'signature',
+    )
+
+    def __init__(
+        self,
+        name: str,
+        doc: str,
+        item_type: str,  # 'class', 'function', 'method', 'module', etc.
+        lineno: int,
+        parent: Optional[str] = None,
+        args: Optional[List[ArgumentInfo]] = None,
+        return_type: Optional[str] = None,
+        fields: Optional[Dict[str, str]] = None,  # For classes, field name to type
+        methods: Optional[List['DocItem']] = None,  # For classes, method DocItems
+        signature: str = "",  # Preformatted def signature for callables
+    ):
+        self.name = name
+        self.doc = doc
+        # item_type draws from a handful of values and parent repeats once
+        # per method, so intern both
+        self.item_type = sys.intern(item_type)
+        self.lineno = lineno
+        self.parent = sys.intern(parent) if parent else parent
+        self.args = args if args is not None else []
+        self.return_type = return_type
+        self.fields = fields if fields is not None else {}
+        self.methods = methods if methods is not None else []
+        self.signature = signature
+
+    def __repr__(self) -> str:
+        return (
+            f"DocItem(name={self.name!r}, item_type={self.item_type!r}, "
+            f"lineno={self.lineno!r}, parent={self.parent!r})"
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DocItem):
+            return NotImplemented
+        return all(
+            getattr(self, slot) == getattr(other, slot)
+            for slot in DocItem.__slots__
+        )
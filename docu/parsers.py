@@ -2,6 +2,12 @@
 
 import os
 import ast
+import mmap
+import re
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import attrgetter
 from typing import Dict, List, Optional, Tuple, Set
 
 from .ast_utils import get_type_str
@@ -10,89 +16,178 @@ from .models import ArgumentInfo, DocItem
 
 def extract_doc_comments(file_path: str) -> List[Tuple[int, str]]:
     """Extract all #/ comments from a Python file.
-    
+
     Args:
         file_path: Path to the Python file
-        
+
     Returns:
         List of (line_number, comment_text) tuples
     """
-    doc_comments: List[Tuple[int, str]] = []
-    
     with open(file_path, 'r', encoding='utf-8') as f:
-        for i, line in enumerate(f, 1):
-            line = line.strip()
-            if line.startswith('#/'):
-                comment = line[2:].strip()
-                doc_comments.append((i, comment))
-    
-    return doc_comments
+        return extract_doc_comments_from_text(f.read())
+
+
+# Matches a #/ doc comment line anywhere in the source, so the scan runs
+# inside the regex engine instead of a per-line Python loop
+_DOC_COMMENT_RE = re.compile(r'^[ \t]*#/(.*)$', re.M)
+
+
+def extract_doc_comments_from_text(content: str) -> List[Tuple[int, str]]:
+    """Extract all #/ comments from already-read source text.
+
+    Args:
+        content: Source code of a Python file
+
+    Returns:
+        List of (line_number, comment_text) tuples
+    """
+    # Offsets where each line begins, for O(log n) match-to-line mapping
+    line_starts = [0]
+    find = content.find
+    pos = find('\n')
+    while pos != -1:
+        line_starts.append(pos + 1)
+        pos = find('\n', pos + 1)
+
+    return [
+        (bisect_right(line_starts, match.start()), match.group(1).strip())
+        for match in _DOC_COMMENT_RE.finditer(content)
+    ]
+
+
+# Last parsed tree per path, validated by content hash; one entry per
+# file keeps watch-mode rebuilds from re-parsing identical content
+_tree_cache: Dict[str, Tuple[int, ast.Module]] = {}
 
 
 def parse_python_file(file_path: str) -> Dict[str, DocItem]:
     """Parse a Python file and extract documentation for code elements.
-    
+
+    Results are memoized on the file's stat signature, so repeated calls
+    for an unchanged file (e.g. rendering several formats or templates)
+    parse it only once.
+
     Args:
         file_path: Path to the Python file
-        
+
     Returns:
         Dictionary of DocItem objects keyed by their full names
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Extract all #/ comments
-    doc_comments = extract_doc_comments(file_path)
-    doc_lines = {line_no: comment for line_no, comment in doc_comments}
-    
-    # Parse the Python file
-    tree = ast.parse(content, filename=file_path)
+    stat = os.stat(file_path)
+    return _parse_python_file_cached(file_path, (stat.st_mtime_ns, stat.st_size))
+
+
+def parse_files(
+    file_paths: List[str], max_workers: Optional[int] = None
+) -> Dict[str, Dict[str, DocItem]]:
+    """Parse many Python files in parallel.
+
+    Parsing is pure CPU work with no shared state, so files fan out over
+    a process pool; chunking amortizes the per-task pickling cost.
+
+    Args:
+        file_paths: Paths of the Python files to parse
+        max_workers: Number of worker processes (defaults to the CPU count)
+
+    Returns:
+        Dictionary mapping each path to its parsed DocItem dictionary
+    """
+    if len(file_paths) <= 1:
+        return {path: parse_python_file(path) for path in file_paths}
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(
+            file_paths,
+            executor.map(parse_python_file, file_paths, chunksize=8),
+        ))
+
+
+# Below this size the plain read() path beats mmap's setup cost
+_MMAP_THRESHOLD = 16 * 1024
+
+
+@lru_cache(maxsize=256)
+def _parse_python_file_cached(
+    file_path: str, stat_key: Tuple[int, int]
+) -> Dict[str, DocItem]:
+    """Do the actual parse for parse_python_file; stat_key invalidates."""
+    with open(file_path, 'rb') as f:
+        if stat_key[1] >= _MMAP_THRESHOLD:
+            # Large files: map the pages in and decode once, skipping the
+            # extra userspace copy a read() would make
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                content = mm[:].decode('utf-8')
+        else:
+            content = f.read().decode('utf-8')
+    # Normalize line endings as text mode would, so line math and the
+    # doc-comment regex see plain \n
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+
+    # Extract all #/ comments from the content already in memory, rather
+    # than re-reading the file
+    doc_comments = extract_doc_comments_from_text(content)
+
+    # Group contiguous comment runs in one linear sweep, keyed by the run's
+    # last line; each def then finds its doc block with a single lookup on
+    # the line directly above it. Most files never use the #/ convention,
+    # so the grouping only runs when comments exist at all.
+    run_ending_at: Dict[int, List[Tuple[int, str]]] = {}
+    if doc_comments:
+        current_run: List[Tuple[int, str]] = []
+        prev_line = None
+        for line_no, comment in doc_comments:
+            if prev_line is not None and line_no == prev_line + 1:
+                current_run.append((line_no, comment))
+            else:
+                if current_run:
+                    run_ending_at[current_run[-1][0]] = current_run
+                current_run = [(line_no, comment)]
+            prev_line = line_no
+        if current_run:
+            run_ending_at[current_run[-1][0]] = current_run
+
+    # Parse the Python file, reusing the prior tree when the content is
+    # unchanged (e.g. a watch-mode save that only touched the mtime)
+    content_hash = hash(content)
+    cached_tree = _tree_cache.get(file_path)
+    if cached_tree is not None and cached_tree[0] == content_hash:
+        tree = cached_tree[1]
+    else:
+        tree = ast.parse(content, filename=file_path)
+        _tree_cache[file_path] = (content_hash, tree)
     
     # Dictionary to store documentation items
     doc_items: Dict[str, DocItem] = {}
-    
-    # Dictionary to map AST nodes to their line ranges
-    node_line_ranges = {}
-    
-    # First pass: identify all AST nodes and their line ranges
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)) and hasattr(node, 'lineno'):
-            # Get the end line number if available (Python 3.8+), otherwise compute it
-            end_lineno = getattr(node, 'end_lineno', None)
-            if end_lineno is None:
-                # Estimate end line by finding the last line of the node's body
-                end_lineno = node.lineno
-                for child in ast.walk(node):
-                    if hasattr(child, 'lineno'):
-                        end_lineno = max(end_lineno, getattr(child, 'lineno', 0))
-            
-            node_line_ranges[node] = (node.lineno, end_lineno)
-    
-    # Identify the top-level nodes sorted by their position in the file
-    top_level_nodes = [
-        node for node in ast.iter_child_nodes(tree)
-        if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))
-    ]
-    top_level_nodes.sort(key=lambda x: x.lineno)
-    
+
     # Identify module-level comments (those before any top-level node)
     module_doc_lines = []
     used_doc_lines = set()
-    
-    # If there are top-level nodes, consider comments before the first one as module-level
-    if top_level_nodes:
-        first_node_line = top_level_nodes[0].lineno
-        for line_no, comment in doc_comments:
-            if line_no < first_node_line:
+
+    if doc_comments:
+        # The module-doc cutoff is simply the line of the first top-level
+        # def/class; tree.body is already in source order, so one linear
+        # scan suffices
+        first_node_line = min(
+            (node.lineno for node in tree.body
+             if isinstance(node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef))),
+            default=None
+        )
+
+        # If there are top-level nodes, consider comments before the first one as module-level
+        if first_node_line is not None:
+            # doc_comments is line-ordered, so bisect to the prefix before
+            # the first node instead of testing every comment in the file
+            prefix_end = bisect_left(doc_comments, (first_node_line, ''))
+            for line_no, comment in doc_comments[:prefix_end]:
                 # No blank line between module comments and first node - check for proximity
                 if first_node_line - line_no > 3:  # Allow a reasonable gap
                     module_doc_lines.append(comment)
                     used_doc_lines.add(line_no)
-    else:
-        # No top-level nodes, all comments are module-level
-        for line_no, comment in doc_comments:
-            module_doc_lines.append(comment)
-            used_doc_lines.add(line_no)
+        else:
+            # No top-level nodes, all comments are module-level
+            for line_no, comment in doc_comments:
+                module_doc_lines.append(comment)
+                used_doc_lines.add(line_no)
     
     # Create module documentation item if module docs exist
     module_name = os.path.basename(file_path).replace('.py', '')
@@ -106,90 +201,102 @@ def parse_python_file(file_path: str) -> Dict[str, DocItem]:
     
     # Track class methods to attach them later
     class_methods = {}
+
+    # Per-file memo so repeated annotations stringify once
+    type_memo: Dict[int, str] = {}
     
-    # Extract class and function documentation
-    for node in ast.walk(tree):
-        if isinstance(node, (ast.FunctionDef, ast.ClassDef, ast.AsyncFunctionDef)):
-            # Find the closest preceding comments that haven't been used yet
-            item_docs: List[str] = []
-            
-            # Start from the line above the node and go backwards
-            for line_no in range(node.lineno - 1, max(0, node.lineno - 20), -1):
-                if line_no in doc_lines and line_no not in used_doc_lines:
-                    # Check if this line is a blank line or marks a break in comments
-                    if line_no + 1 not in doc_lines and line_no != node.lineno - 1:
-                        break
-                    
-                    item_docs.insert(0, doc_lines[line_no])
+    # Extract class and function documentation. An explicit stack that only
+    # descends into ClassDef bodies replaces ast.walk, which yielded every
+    # expression node in the file; the stack also carries the parent class
+    # name so no separate parent lookup is needed.
+    def_nodes = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+    pending = [
+        (node, None) for node in reversed(tree.body)
+        if isinstance(node, def_nodes)
+    ]
+    while pending:
+        node, parent = pending.pop()
+
+        # The node's documentation is the contiguous comment run ending
+        # on the line directly above it
+        item_docs: List[str] = []
+        run = run_ending_at.get(node.lineno - 1)
+        if run:
+            for line_no, comment in run:
+                if line_no not in used_doc_lines:
+                    item_docs.append(comment)
                     used_doc_lines.add(line_no)
-                elif line_no not in doc_lines:
-                    # Stop if we hit a non-documented line (except for blank lines)
-                    with open(file_path, 'r') as f:
-                        lines = f.readlines()
-                    if line_no < len(lines) and lines[line_no].strip():
-                        break
-            
-            parent = None
-            for parent_node in ast.walk(tree):
-                if (
-                    isinstance(parent_node, ast.ClassDef)
-                    and parent_node.lineno < node.lineno
-                    and node in parent_node.body
-                ):
-                    parent = parent_node.name
-                    break
-            
-            item_type = 'class' if isinstance(node, ast.ClassDef) else 'function'
-            if parent and item_type == 'function':
-                item_type = 'method'
-            
-            # Extract argument information
-            args = []
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                for arg in node.args.args:
-                    if arg.arg == 'self':
-                        continue
-                    type_hint = None
-                    if arg.annotation:
-                        type_hint = get_type_str(arg.annotation)
-                    args.append(ArgumentInfo(name=arg.arg, type_hint=type_hint))
-            
-            # Extract return type
-            return_type = None
-            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.returns:
-                return_type = get_type_str(node.returns)
-            
-            # Extract class fields
-            fields = {}
-            if isinstance(node, ast.ClassDef):
-                for child in node.body:
-                    if isinstance(child, ast.AnnAssign) and isinstance(child.target, ast.Name):
-                        fields[child.target.id] = get_type_str(child.annotation)
-            
-            doc_item = DocItem(
-                name=node.name,
-                doc='\n'.join(item_docs) if item_docs else "",
-                item_type=item_type,
-                lineno=node.lineno,
-                parent=parent,
-                args=args,
-                return_type=return_type,
-                fields=fields
+
+        item_type = 'class' if isinstance(node, ast.ClassDef) else 'function'
+        if parent and item_type == 'function':
+            item_type = 'method'
+
+        # Extract argument information
+        args = []
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            for arg in node.args.args:
+                if arg.arg == 'self':
+                    continue
+                type_hint = None
+                if arg.annotation:
+                    type_hint = get_type_str(arg.annotation, type_memo)
+                args.append(ArgumentInfo(name=arg.arg, type_hint=type_hint))
+
+        # Extract return type
+        return_type = None
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.returns:
+            return_type = get_type_str(node.returns, type_memo)
+
+        # Extract class fields, and queue the class body for the next
+        # round of the walk
+        fields = {}
+        if isinstance(node, ast.ClassDef):
+            for child in node.body:
+                if isinstance(child, ast.AnnAssign) and isinstance(child.target, ast.Name):
+                    fields[child.target.id] = get_type_str(child.annotation, type_memo)
+            pending.extend(
+                (child, node.name) for child in reversed(node.body)
+                if isinstance(child, def_nodes)
+            )
+
+        # Format the signature once here so every downstream renderer
+        # (markdown, HTML, multiple templates) reuses the same string
+        signature = ""
+        if item_type != 'class':
+            args_str = ", ".join(
+                f"{arg.name}: {arg.type_hint or 'Any'}" for arg in args
             )
-            
-            # Store methods separately to attach to classes later
-            if item_type == 'method':
-                if parent not in class_methods:
-                    class_methods[parent] = []
-                class_methods[parent].append(doc_item)
-                continue  # Don't add methods to doc_items directly
-            
-            full_name = f"{parent}.{node.name}" if parent else node.name
-            doc_items[full_name] = doc_item
+            signature = f"def {node.name}({args_str})"
+            if return_type:
+                signature += f" -> {return_type}"
+
+        doc_item = DocItem(
+            name=node.name,
+            doc='\n'.join(item_docs) if item_docs else "",
+            item_type=item_type,
+            lineno=node.lineno,
+            parent=parent,
+            args=args,
+            return_type=return_type,
+            fields=fields,
+            signature=signature
+        )
+
+        # Store methods separately to attach to classes later
+        if item_type == 'method':
+            if parent not in class_methods:
+                class_methods[parent] = []
+            class_methods[parent].append(doc_item)
+            continue  # Don't add methods to doc_items directly
+
+        full_name = f"{parent}.{node.name}" if parent else node.name
+        doc_items[full_name] = doc_item
     
     # Attach methods to their respective classes
+    by_lineno = attrgetter('lineno')
     for class_name, methods in class_methods.items():
         if class_name in doc_items:
-            doc_items[class_name].methods = sorted(methods, key=lambda x: x.lineno)
+            methods.sort(key=by_lineno)
+            doc_items[class_name].methods = methods
     
     return doc_items
\ No newline at end of file
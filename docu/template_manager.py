@@ -1,8 +1,37 @@
 """Template manager for docu."""
 from pathlib import Path
+import functools
 import json
-from typing import Dict, Any, Optional, List
-from jinja2 import Environment, FileSystemLoader, Template
+import os
+from typing import Dict, Any, Optional, List, Union
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+
+@functools.lru_cache(maxsize=None)
+def _load_json(path_str: str, mtime: float) -> Dict[str, Any]:
+    """Load a JSON file, cached on (path, mtime) across manager instances.
+
+    The schema and per-template configs are tiny and effectively static,
+    so one TemplateManager per processed file shouldn't re-read them.
+    """
+    with open(path_str) as f:
+        return json.load(f)
+
+
+def _load_json_cached(path: Path) -> Dict[str, Any]:
+    """Stat a path and return its cached JSON content."""
+    return _load_json(str(path), path.stat().st_mtime)
+
+
+class _MiniJinjaTemplate:
+    """Adapter giving a minijinja template the Jinja2 render(**data) shape."""
+
+    def __init__(self, env, name: str):
+        self._env = env
+        self._name = name
+
+    def render(self, **data) -> str:
+        return self._env.render_template(self._name, **data)
 
 class TemplateManager:
     """Template manager for documentation generation.
@@ -23,14 +52,53 @@ class TemplateManager:
         if templates_dir is None:
             templates_dir = Path(__file__).parent / 'templates'
         self.templates_dir = Path(templates_dir)
-        self.env = Environment(loader=FileSystemLoader(str(self.templates_dir)))
+        # A filesystem bytecode cache carries compiled templates across
+        # processes, so repeated CLI runs skip Jinja's parse+compile;
+        # auto_reload stays on so watch-mode template edits are picked up.
+        # The cached bytecode is executed when loaded, so the directory
+        # lives under the user's own cache dir with mode 0700 and is
+        # skipped entirely if another user owns it or opened it up.
+        cache_dir = Path.home() / '.cache' / 'docu' / 'jinja'
+        bytecode_cache = None
+        try:
+            cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+            cache_stat = cache_dir.stat()
+            owned = not hasattr(os, 'getuid') or cache_stat.st_uid == os.getuid()
+            private = not (cache_stat.st_mode & 0o077)
+            if owned and private:
+                bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+        except OSError:
+            bytecode_cache = None
+        self.env = Environment(
+            loader=FileSystemLoader(str(self.templates_dir)),
+            bytecode_cache=bytecode_cache,
+        )
         self.schema = self._load_schema()
+        # Per-instance caches so batch runs stat and glob the templates
+        # directory once instead of per rendered file
+        self._template_cache: Dict[str, Union[Template, _MiniJinjaTemplate]] = {}
+        self._listing_cache: Optional[List[Dict[str, str]]] = None
+        self._listing_mtime: Optional[float] = None
+        # Optional Rust-backed renderer, opt-in via DOCU_MINIJINJA=1;
+        # Jinja2 stays the default and the fallback
+        self._minijinja_env = None
+        if os.environ.get('DOCU_MINIJINJA') == '1':
+            try:
+                import minijinja
+            except ImportError:
+                pass
+            else:
+                self._minijinja_env = minijinja.Environment(
+                    loader=self._read_template_source
+                )
+
+    def _read_template_source(self, name: str) -> str:
+        """Load template source for the minijinja environment."""
+        return (self.templates_dir / name).read_text(encoding='utf-8')
 
     def _load_schema(self) -> Dict[str, Any]:
         """Load template schema from JSON file."""
-        schema_path = self.templates_dir / 'schema.json'
-        with open(schema_path) as f:
-            return json.load(f)
+        return _load_json_cached(self.templates_dir / 'schema.json')
 
     def list_templates(self) -> List[Dict[str, str]]:
         """List all available templates with their descriptions.
@@ -38,17 +106,21 @@ class TemplateManager:
         Returns:
             List of dictionaries containing template info (name, description)
         """
+        # Reuse the previous listing while the directory mtime is unchanged
+        dir_mtime = self.templates_dir.stat().st_mtime
+        if self._listing_cache is not None and self._listing_mtime == dir_mtime:
+            return self._listing_cache
+
         templates = []
         for template_file in self.templates_dir.glob('*.html'):
             name = template_file.stem
             try:
-                with open(self.templates_dir / f'{name}.json', 'r') as f:
-                    config = json.load(f)
-                    templates.append({
-                        'name': name,
-                        'description': config.get('description', ''),
-                        'doc_style': config.get('docstyle', 'google')
-                    })
+                config = _load_json_cached(self.templates_dir / f'{name}.json')
+                templates.append({
+                    'name': name,
+                    'description': config.get('description', ''),
+                    'doc_style': config.get('docstyle', 'google')
+                })
             except FileNotFoundError:
                 if name == 'default':
                     templates.append({
@@ -56,27 +128,38 @@ class TemplateManager:
                         'description': 'Default template with clean, responsive design',
                         'doc_style': 'google'
                     })
+        self._listing_cache = templates
+        self._listing_mtime = dir_mtime
         return templates
 
-    def get_template(self, name: str = 'default') -> Template:
+    def get_template(self, name: str = 'default') -> Union[Template, _MiniJinjaTemplate]:
         """Get template by name.
 
         Args:
             name: Name of the template to load
 
         Returns:
-            Jinja2 Template object
+            Template object exposing render(**data); Jinja2 by default,
+            or a minijinja adapter when DOCU_MINIJINJA=1
 
         Raises:
             ValueError: If template is not found
         """
+        cached = self._template_cache.get(name)
+        if cached is not None:
+            return cached
         if not (self.templates_dir / f'{name}.html').exists():
             available = [t['name'] for t in self.list_templates()]
             templates_str = '\n- '.join([''] + available)
             raise ValueError(
                 f"Template '{name}' not found. Available templates:{templates_str}"
             )
-        return self.env.get_template(f'{name}.html')
+        if self._minijinja_env is not None:
+            template = _MiniJinjaTemplate(self._minijinja_env, f'{name}.html')
+        else:
+            template = self.env.get_template(f'{name}.html')
+        self._template_cache[name] = template
+        return template
 
     def validate_template(self, template_data: Dict[str, Any]) -> bool:
         """Validate template data against schema.
@@ -4,25 +4,38 @@ This module provides capabilities for:
 1. Watching for file changes and regenerating documentation
 2. Running a live preview server for HTML documentation
 """
+import functools
+import glob
+import hashlib
 import os
 import time
 import threading
-from typing import Callable, List, Optional, Dict, Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Dict, Any, Set
 from pathlib import Path
-import glob
 import json
 
 import livereload
 import tornado.web
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileSystemEvent
+from watchdog.events import PatternMatchingEventHandler, FileSystemEvent
 
 from .docgen import process_file
 
 
-class DocuHandler(FileSystemEventHandler):
-    """File system event handler for regenerating documentation."""
-    
+# Editors typically fire several events per save (temp file, rename,
+# chmod); collapse them into one rebuild per file within this window.
+DEBOUNCE_SECONDS = 0.3
+
+
+class DocuHandler(PatternMatchingEventHandler):
+    """File system event handler for regenerating documentation.
+
+    The watched paths double as match patterns, so events for unrelated
+    files in the same directories (editor temp files, build output) are
+    dropped in watchdog's dispatch before reaching the handlers below.
+    """
+
     def __init__(
         self,
         target_paths: List[str],
@@ -44,51 +57,197 @@ class DocuHandler(FileSystemEventHandler):
             callback: Function to call after regenerating documentation
             verbose: Whether to print verbose output
         """
-        self.target_paths = {os.path.abspath(path) for path in target_paths}
+        self.target_paths = frozenset(
+            os.path.abspath(path) for path in target_paths
+        )
+        # Patterns go through fnmatch, so literal paths must be escaped or
+        # glob metacharacters in a filename ([, ?, *) silently unmatch it;
+        # _schedule's set-membership re-check stays as the exact filter
+        super().__init__(
+            patterns=[glob.escape(path) for path in sorted(self.target_paths)],
+            ignore_directories=True
+        )
         self.output_format = output_format
         self.output_dir = output_dir
         self.template_name = template_name
         self.doc_style = doc_style
         self.callback = callback
         self.verbose = verbose
-        
+        # Changed paths collected until the debounce window closes, so an
+        # IDE format-all or git checkout becomes one flush, not N
+        self._batch: Set[str] = set()
+        self._batch_timer: Optional[threading.Timer] = None
+        self._batch_lock = threading.Lock()
+        # Last-seen content digest per file; no-op saves (vim :w with no
+        # change, touch, autosave) skip the whole pipeline
+        self._content_hashes: Dict[str, bytes] = {}
+
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification events.
-        
+
         Args:
             event: The file system event
         """
-        if event.is_directory:
+        self._schedule(event.src_path)
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        """Handle file creation events (some editors recreate on save).
+
+        Args:
+            event: The file system event
+        """
+        self._schedule(event.src_path)
+
+    def on_moved(self, event: FileSystemEvent) -> None:
+        """Handle rename events from atomic saves (temp file -> target).
+
+        Args:
+            event: The file system event
+        """
+        self._schedule(event.dest_path)
+
+    def _schedule(self, src_path: str) -> None:
+        """Debounce a change to src_path into a single regeneration.
+
+        Args:
+            src_path: Path reported by the file system event
+        """
+        # Watches are scheduled on absolute directories, so event paths
+        # arrive absolute; normpath is a pure string op, unlike abspath,
+        # which calls getcwd() per event
+        file_path = os.path.normpath(src_path)
+        if not os.path.isabs(file_path):
+            file_path = os.path.abspath(file_path)
+
+        # Dispatch matched on patterns already; this re-check only guards
+        # the moved case, where the matching path may have been the source
+        if file_path in self.target_paths:
+            # Debounce: collect the path and restart the flush timer so a
+            # burst of events across any number of files triggers a
+            # single batched regeneration
+            with self._batch_lock:
+                self._batch.add(file_path)
+                if self._batch_timer is not None:
+                    self._batch_timer.cancel()
+                timer = threading.Timer(DEBOUNCE_SECONDS, self._flush_batch)
+                timer.daemon = True
+                self._batch_timer = timer
+                timer.start()
+
+    def _flush_batch(self) -> None:
+        """Regenerate documentation for every path in the current batch."""
+        with self._batch_lock:
+            paths = sorted(self._batch)
+            self._batch.clear()
+            self._batch_timer = None
+
+        if not paths:
             return
-            
-        file_path = os.path.abspath(event.src_path)
-        
-        # Only process Python files that are in our target paths
-        if file_path.endswith('.py') and file_path in self.target_paths:
+        if len(paths) == 1:
+            self._regenerate(paths[0])
+        else:
+            # Regeneration is I/O-heavy enough for threads to overlap
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as pool:
+                list(pool.map(self._regenerate, paths))
+
+    def _regenerate(self, file_path: str) -> None:
+        """Regenerate documentation for a changed file.
+
+        Args:
+            file_path: Absolute path of the file that changed
+        """
+        # Only regenerate when the bytes actually changed
+        try:
+            with open(file_path, 'rb') as f:
+                digest = hashlib.blake2b(f.read()).digest()
+        except OSError:
+            digest = None
+        if digest is not None:
+            if self._content_hashes.get(file_path) == digest:
+                return
+            self._content_hashes[file_path] = digest
+
+        if self.verbose:
+            print(f"File changed: {file_path}")
+            print(f"Regenerating documentation...")
+
+        try:
+            output = process_file(
+                file_path,
+                output_format=self.output_format,
+                output_dir=self.output_dir,
+                template_name=self.template_name,
+                doc_style=self.doc_style
+            )
+
             if self.verbose:
-                print(f"File changed: {file_path}")
-                print(f"Regenerating documentation...")
-                
-            try:
-                output = process_file(
-                    file_path,
-                    output_format=self.output_format,
-                    output_dir=self.output_dir,
-                    template_name=self.template_name,
-                    doc_style=self.doc_style
-                )
-                
-                if self.verbose:
-                    if self.output_dir:
-                        print(f"Documentation saved to: {output}")
-                    else:
-                        print("Documentation regenerated")
-                
-                if self.callback:
-                    self.callback(output)
-                    
-            except Exception as e:
-                print(f"Error regenerating documentation: {e}")
+                if self.output_dir:
+                    print(f"Documentation saved to: {output}")
+                else:
+                    print("Documentation regenerated")
+
+            if self.callback:
+                self.callback(output)
+
+        except Exception as e:
+            print(f"Error regenerating documentation: {e}")
+
+
+# Filesystem types where inotify never fires; these need polling
+_NETWORK_FS_TYPES = frozenset({'nfs', 'nfs4', 'cifs', 'smbfs', 'sshfs', 'fuse.sshfs'})
+
+# One observer (thread + inotify fd) shared by all watch_files calls in
+# this process, instead of spawning a fresh one per call
+_observer: Optional[Observer] = None
+_observer_lock = threading.Lock()
+
+
+def _uses_network_fs(directories) -> bool:
+    """Report whether any of the directories sits on a network filesystem.
+
+    Args:
+        directories: Directories about to be watched
+
+    Returns:
+        True if a directory resolves to an NFS/SMB-style mount
+    """
+    try:
+        with open('/proc/mounts') as f:
+            mounts = [line.split()[1:3] for line in f if len(line.split()) >= 3]
+    except OSError:
+        return False
+    for directory in directories:
+        # Longest matching mount point wins
+        best = max(
+            (m for m in mounts if directory == m[0] or directory.startswith(m[0].rstrip('/') + '/')),
+            key=lambda m: len(m[0]),
+            default=None,
+        )
+        if best is not None and best[1] in _NETWORK_FS_TYPES:
+            return True
+    return False
+
+
+def _get_observer(directories) -> Observer:
+    """Return the running shared observer, creating it on first use.
+
+    Args:
+        directories: Directories that will be scheduled on the observer
+
+    Returns:
+        A started Observer (polling variant on network filesystems)
+    """
+    global _observer
+    with _observer_lock:
+        if _observer is None or not _observer.is_alive():
+            if _uses_network_fs(directories):
+                # inotify does not see remote writes; poll instead
+                from watchdog.observers.polling import PollingObserver
+                _observer = PollingObserver(timeout=2.0)
+            else:
+                _observer = Observer()
+            _observer.start()
+        return _observer
 
 
 def watch_files(
@@ -116,8 +275,8 @@ def watch_files(
     """
     # Get unique directories to watch
     dirs_to_watch = {os.path.dirname(os.path.abspath(file_path)) for file_path in file_paths}
-    
-    observer = Observer()
+
+    observer = _get_observer(dirs_to_watch)
     handler = DocuHandler(
         file_paths,
         output_format=output_format,
@@ -130,76 +289,17 @@ def watch_files(
     
     for directory in dirs_to_watch:
         observer.schedule(handler, directory, recursive=False)
-    
-    observer.start()
-    
+
     if verbose:
         print(f"Watching {len(file_paths)} files for changes...")
         
     return observer
 
 
-def create_index_html(directory: str, skip_livereload_script: bool = False) -> str:
-    """Create an index.html file in the given directory with links to all documentation files.
-    
-    Args:
-        directory: Directory to scan for HTML and Markdown files
-        skip_livereload_script: Whether to skip adding the livereload script
-    
-    Returns:
-        Path to the created index.html file
-    """
-    # Get all documentation files (HTML and Markdown)
-    html_files = glob.glob(os.path.join(directory, "*.html"))
-    md_files = glob.glob(os.path.join(directory, "*.md"))
-    all_files = html_files + md_files
-    
-    # Filter out index.html from the list to avoid displaying it
-    all_files = [f for f in all_files if os.path.basename(f) != "index.html"]
-    
-    # Sort files by modification time (newest first)
-    all_files.sort(key=lambda x: os.path.getmtime(x), reverse=True)
-    
-    files_html = ""
-    
-    if not all_files:
-        files_html = """
-        <div class="no-files">
-            <h3>No documentation files found</h3>
-            <p>No HTML or Markdown files were found in this directory.</p>
-            <p>Try generating documentation first with: <br><code>docu your_file.py --output-dir docs</code></p>
-        </div>
-        """
-    else:
-        # Generate HTML file cards
-        for file_path in all_files:
-            file_name = os.path.basename(file_path)
-            mod_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(os.path.getmtime(file_path)))
-            
-            # Get file type and try to extract template info for HTML files
-            file_ext = os.path.splitext(file_path)[1][1:].upper()
-            template_html = ""
-            
-            if file_ext.lower() == "html":
-                # Check if filename contains template info (name_template.html format)
-                name_parts = os.path.splitext(file_name)[0].split('_')
-                if len(name_parts) > 1:
-                    template_html = f'<span class="template-tag">{name_parts[-1]}</span>'
-            
-            files_html += f"""
-            <div class="file-card">
-                <a href="{file_name}">{file_name}</a>
-                <div class="file-info">
-                    {file_ext} document {template_html}
-                </div>
-                <div class="file-modified">
-                    Modified: {mod_time}
-                </div>
-            </div>
-            """
-    
-    # Create the full HTML file
-    html_content = f"""
+# Static index shell: everything above the file-card list never changes,
+# so it is built once at import and written once per index file. The
+# dynamic tail (cards, footer, script) starts right after it.
+_INDEX_HEAD = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -207,47 +307,47 @@ def create_index_html(directory: str, skip_livereload_script: bool = False) -> s
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Docu: Documentation Index</title>
         <style>
-            body {{
+            body {
                 font-family: system-ui, -apple-system, "Segoe UI", Roboto, sans-serif;
                 line-height: 1.6;
                 max-width: 1200px;
                 margin: 0 auto;
                 padding: 2rem;
                 color: #333;
-            }}
-            h1 {{
+            }
+            h1 {
                 border-bottom: 1px solid #eaecef;
                 padding-bottom: 0.5rem;
-            }}
-            .files {{
+            }
+            .files {
                 display: grid;
                 grid-template-columns: repeat(auto-fill, minmax(300px, 1fr));
                 gap: 1rem;
                 margin: 2rem 0;
-            }}
-            .file-card {{
+            }
+            .file-card {
                 border: 1px solid #e1e4e8;
                 border-radius: 6px;
                 padding: 1rem;
                 transition: all 0.2s ease;
-            }}
-            .file-card:hover {{
+            }
+            .file-card:hover {
                 transform: translateY(-3px);
                 box-shadow: 0 4px 12px rgba(0,0,0,0.1);
-            }}
-            .file-card a {{
+            }
+            .file-card a {
                 text-decoration: none;
                 color: #0366d6;
                 font-weight: 500;
                 font-size: 1.1rem;
                 display: block;
                 margin-bottom: 0.5rem;
-            }}
-            .file-info {{
+            }
+            .file-info {
                 font-size: 0.9rem;
                 color: #666;
-            }}
-            .template-tag {{
+            }
+            .template-tag {
                 display: inline-block;
                 background: #f1f8ff;
                 color: #0366d6;
@@ -255,33 +355,149 @@ def create_index_html(directory: str, skip_livereload_script: bool = False) -> s
                 padding: 0.1rem 0.4rem;
                 margin-left: 0.5rem;
                 font-size: 0.8rem;
-            }}
-            .file-modified {{
+            }
+            .file-modified {
                 margin-top: 0.5rem;
                 font-size: 0.85rem;
                 color: #888;
-            }}
-            .footer {{
+            }
+            .footer {
                 margin-top: 2rem;
                 padding-top: 1rem;
                 border-top: 1px solid #eaecef;
                 font-size: 0.9rem;
                 color: #666;
-            }}
-            .no-files {{
+            }
+            .no-files {
                 background: #f6f8fa;
                 border-radius: 6px;
                 padding: 1.5rem;
                 text-align: center;
                 margin: 2rem 0;
-            }}
+            }
         </style>
     </head>
     <body>
         <h1>Docu Documentation Index</h1>
         <p>Select a documentation file to view:</p>
         <div class="files">
-            {files_html}
+            """
+_INDEX_HEAD_BYTES = _INDEX_HEAD.encode('utf-8')
+
+# Index files whose static head this process has already written; their
+# updates can rewrite only the dynamic tail in place
+_index_heads_written = set()
+
+
+def _is_editor_temp(path: str) -> bool:
+    """Report whether a path looks like an editor/OS temp file.
+
+    Args:
+        path: Path reported by a file watcher
+
+    Returns:
+        True for swap, backup and hidden files that should never trigger
+        an index update
+    """
+    name = os.path.basename(path)
+    return name.startswith('.') or name.endswith(('.swp', '.swx', '.tmp', '~'))
+
+
+def _scan_docs(directory: str) -> List[os.DirEntry]:
+    """List the documentation files in a directory with one scandir pass.
+
+    Args:
+        directory: Directory to scan
+
+    Returns:
+        DirEntry objects for the .html/.md files, excluding index.html;
+        each entry carries a cached stat result
+    """
+    with os.scandir(directory) as entries:
+        return [
+            entry for entry in entries
+            if entry.name != 'index.html'
+            and (entry.name.endswith('.html') or entry.name.endswith('.md'))
+            and entry.is_file(follow_symlinks=False)
+        ]
+
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_mtime(mtime_int: int) -> str:
+    """Format an mtime for the index; cached since bulk regeneration
+    stamps many files within the same second."""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(mtime_int))
+
+
+def _render_file_cards(all_files: List[os.DirEntry]) -> str:
+    """Render the file-card fragment for the documentation index.
+
+    Args:
+        all_files: DirEntry objects for the files, sorted newest-first
+
+    Returns:
+        HTML fragment listing the files (or the empty-state block)
+    """
+    if not all_files:
+        return """
+        <div class="no-files">
+            <h3>No documentation files found</h3>
+            <p>No HTML or Markdown files were found in this directory.</p>
+            <p>Try generating documentation first with: <br><code>docu your_file.py --output-dir docs</code></p>
+        </div>
+        """
+
+    files_html = []
+    for entry in all_files:
+        file_name = entry.name
+        # DirEntry.stat() is served from the scandir cache, no syscall
+        mod_time = _fmt_mtime(int(entry.stat().st_mtime))
+
+        # Get file type and try to extract template info for HTML files
+        file_ext = os.path.splitext(file_name)[1][1:].upper()
+        template_html = ""
+
+        if file_ext.lower() == "html":
+            # Check if filename contains template info (name_template.html format)
+            name_parts = os.path.splitext(file_name)[0].split('_')
+            if len(name_parts) > 1:
+                template_html = f'<span class="template-tag">{name_parts[-1]}</span>'
+
+        files_html.append(f"""
+            <div class="file-card">
+                <a href="{file_name}">{file_name}</a>
+                <div class="file-info">
+                    {file_ext} document {template_html}
+                </div>
+                <div class="file-modified">
+                    Modified: {mod_time}
+                </div>
+            </div>
+            """)
+    return "".join(files_html)
+
+
+def create_index_html(directory: str, skip_livereload_script: bool = False) -> str:
+    """Create an index.html file in the given directory with links to all documentation files.
+
+    Args:
+        directory: Directory to scan for HTML and Markdown files
+        skip_livereload_script: Whether to skip adding the livereload script
+
+    Returns:
+        Path to the created index.html file
+    """
+    # Get all documentation files (HTML and Markdown) in one directory
+    # read; entries carry their stat, so the sort costs no extra syscalls
+    all_files = _scan_docs(directory)
+
+    # Sort files by modification time (newest first)
+    all_files.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+
+    files_html = _render_file_cards(all_files)
+
+    # Only this tail changes between updates
+    tail = f"""{files_html}
         </div>
         <div class="footer">
             <p>Generated by Docu. Access specific files directly by their URL.</p>
@@ -293,51 +509,58 @@ def create_index_html(directory: str, skip_livereload_script: bool = False) -> s
     </body>
     </html>
     """
-    
-    # Write the HTML file to the directory
+
     index_path = os.path.join(directory, "index.html")
-    with open(index_path, "w") as f:
-        f.write(html_content)
-    
+    if index_path in _index_heads_written and os.path.exists(index_path):
+        # The static shell is already on disk; rewrite just the dynamic
+        # tail instead of re-emitting ~3KB of CSS per save
+        with open(index_path, "r+b") as f:
+            f.seek(len(_INDEX_HEAD_BYTES))
+            f.write(tail.encode('utf-8'))
+            f.truncate()
+    else:
+        # Full write goes through a temp file and an atomic rename, so a
+        # concurrent reader (the preview server) never sees a truncated
+        # index
+        tmp_path = index_path + '.tmp'
+        with open(tmp_path, "wb") as f:
+            f.write(_INDEX_HEAD_BYTES)
+            f.write(tail.encode('utf-8'))
+        os.replace(tmp_path, index_path)
+        _index_heads_written.add(index_path)
+
     return index_path
 
 
-# File list cache to avoid unnecessary index.html updates
-_file_list_cache = {}
+# Per-directory fingerprint of the doc-file listing, used to skip
+# index.html updates when nothing changed. XOR-folding the per-file
+# hashes gives an order-independent integer, so the comparison is O(1)
+# instead of frozenset equality; the lock covers the livereload and
+# watchdog threads both calling in.
+_file_list_cache: Dict[str, int] = {}
+_file_list_lock = threading.Lock()
 
 def should_update_index(directory: str) -> bool:
     """Check if the index.html file needs to be updated.
-    
+
     Args:
         directory: Directory to scan for changes
-    
+
     Returns:
         True if the files have changed since the last check, False otherwise
     """
-    global _file_list_cache
-    
-    # Get all HTML and Markdown files
-    html_files = set(glob.glob(os.path.join(directory, "*.html")))
-    md_files = set(glob.glob(os.path.join(directory, "*.md")))
-    all_files = html_files | md_files
-    
-    # Remove index.html from the list
-    index_path = os.path.join(directory, "index.html")
-    if index_path in all_files:
-        all_files.remove(index_path)
-    
-    # Get file names and modification times as a cache key
-    current_state = frozenset(
-        (os.path.basename(f), os.path.getmtime(f)) 
-        for f in all_files
-    )
-    
-    # Check if the state has changed
-    cache_key = directory
-    if cache_key not in _file_list_cache or _file_list_cache[cache_key] != current_state:
-        _file_list_cache[cache_key] = current_state
-        return True
-    
+    # One scandir pass replaces two globs plus a getmtime per file: the
+    # DirEntry carries the type and stat result, so each file costs at
+    # most one syscall. st_mtime_ns keeps the hash exact.
+    fingerprint = 0
+    for entry in _scan_docs(directory):
+        fingerprint ^= hash((entry.name, entry.stat().st_mtime_ns))
+
+    with _file_list_lock:
+        if _file_list_cache.get(directory) != fingerprint:
+            _file_list_cache[directory] = fingerprint
+            return True
+
     return False
 
 
@@ -355,37 +578,43 @@ def run_livereload_server(
     directory: str,
     port: int = 8000,
     host: str = "localhost",
-    verbose: bool = False
+    verbose: bool = False,
+    update_index: bool = True
 ) -> None:
     """Run a live reload server for previewing HTML documentation.
-    
+
     Args:
         directory: Directory containing HTML files to serve
         port: Port to run the server on
         host: Host to bind the server to
         verbose: Whether to print verbose output
+        update_index: Whether to rescan the directory and refresh
+            index.html on changes; pass False when the caller already
+            updates the index as files are regenerated
     """
     # Ensure we have an absolute directory path
     directory = os.path.abspath(directory)
-    
+
     # Create an index.html file for directory listing
     create_index_html(directory)
-    
+
     # Create a standard server
     server = livereload.Server()
-    
+
     # Watch for changes to HTML and Markdown files
     server.watch(os.path.join(directory, "*.html"), lambda: None)
     server.watch(os.path.join(directory, "*.md"), lambda: None)
-    
-    # Add a handler to update the index.html only when the set of files changes
-    # This is essential to prevent the infinite loop
-    def safe_update_index():
-        update_index_if_needed(directory)
-    
-    # Watch the directory with a throttled callback
-    server.watch(directory, safe_update_index)
-    
+
+    if update_index:
+        # Add a handler to update the index.html only when the set of files changes
+        # This is essential to prevent the infinite loop
+        def safe_update_index():
+            update_index_if_needed(directory)
+
+        # Watch the directory with a throttled callback, skipping the
+        # temp files editors churn out during atomic saves
+        server.watch(directory, safe_update_index, ignore=_is_editor_temp)
+
     if verbose:
         print(f"Starting live preview server at http://{host}:{port}")
         print(f"Serving files from {directory}")
@@ -419,41 +648,55 @@ def watch_and_serve(
     # Create output directory if it doesn't exist
     os.makedirs(output_dir, exist_ok=True)
     
-    # Generate initial documentation for all files
+    # Generate initial documentation for all files, fanning out across
+    # cores; per-file work is CPU-bound and independent
     if verbose:
         print("Generating initial documentation...")
-        
-    for file_path in file_paths:
-        try:
-            output = process_file(
+
+    with ProcessPoolExecutor() as pool:
+        futures = {
+            pool.submit(
+                process_file,
                 file_path,
                 output_format='html',
                 output_dir=output_dir,
                 template_name=template_name,
                 doc_style=doc_style
-            )
-            if verbose:
-                print(f"Generated: {output}")
-        except Exception as e:
-            print(f"Error generating documentation for {file_path}: {e}")
+            ): file_path
+            for file_path in file_paths
+        }
+        for future in as_completed(futures):
+            try:
+                output = future.result()
+                if verbose:
+                    print(f"Generated: {output}")
+            except Exception as e:
+                print(f"Error generating documentation for {futures[future]}: {e}")
     
-    # Start the file watcher
+    # Start the file watcher. The regeneration callback refreshes the
+    # index right after each output write, so the server needs no
+    # directory-wide rescan watch of its own.
+    def _refresh_index(_output: str) -> None:
+        update_index_if_needed(output_dir)
+
     observer = watch_files(
         file_paths,
         output_format='html',
         output_dir=output_dir,
         template_name=template_name,
         doc_style=doc_style,
+        callback=_refresh_index,
         verbose=verbose
     )
-    
+
     try:
         # Start the livereload server (this will block)
         run_livereload_server(
             directory=output_dir,
             port=port,
             host=host,
-            verbose=verbose
+            verbose=verbose,
+            update_index=False
         )
     except KeyboardInterrupt:
         observer.stop()
@@ -52,9 +52,7 @@ def average(numbers: List[float]) -> Optional[float]:
 def factorial(n: int) -> int:
     if n < 0:
         raise ValueError("Factorial is not defined for negative numbers")
-    if n <= 1:
-        return 1
-    return n * factorial(n - 1)
+    return math.factorial(n)
 
 
 # This is a regular Python comment and will NOT be included in the documentation
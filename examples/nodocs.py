@@ -1,3 +1,4 @@
+import math
 from typing import List, Optional, Union
 
 class Calculator:
@@ -20,6 +21,4 @@ def calculate_average(numbers: List[float]) -> Optional[float]:
 def factorial(n: int) -> int:
     if n < 0:
         raise ValueError("Factorial is not defined for negative numbers")
-    if n == 0:
-        return 1
-    return n * factorial(n - 1)
\ No newline at end of file
+    return math.factorial(n)
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""Shared fixtures for the docu test suite.
+
+Fixture files are written with a single ``write_text``/``write_bytes``
+call; avoid incremental ``write()`` + ``flush()`` sequences in fixtures,
+which multiply syscalls for payloads that fit one buffered write.
+"""
+import pytest
+
+from docu.models import DocItem
+from docu.template_manager import TemplateManager
+
+
+@pytest.fixture(scope="session")
+def template_manager():
+    """One TemplateManager for the whole session.
+
+    The manager caches resolved templates and directory listings, so
+    sharing the instance means each template is loaded and compiled once
+    per run instead of once per test.
+    """
+    return TemplateManager()
+
+
+@pytest.fixture(scope="session")
+def sample_doc_items():
+    """Synthetic DocItem tree shared by the generator tests.
+
+    Session-scoped: the consumers only read from it, so the DocItem
+    construction happens once per run.
+    """
+    return {
+        "module": DocItem(
+            name="module",
+            doc="Module docs\nWith multiple lines",
+            item_type="module",
+            lineno=1
+        ),
+        "Class": DocItem(
+            name="Class",
+            doc="Class docs",
+            item_type="class",
+            lineno=5,
+            fields={"field1": "int", "field2": "str"},
+            methods=[
+                DocItem(
+                    name="method",
+                    doc="Method docs",
+                    item_type="method",
+                    lineno=7,
+                    parent="Class",
+                    args=[{"name": "arg1", "type_hint": "int"}],
+                    return_type="bool"
+                )
+            ]
+        ),
+        "function": DocItem(
+            name="function",
+            doc="Function docs",
+            item_type="function",
+            lineno=10,
+            args=[{"name": "param1", "type_hint": "str"}],
+            return_type="None"
+        ),
+    }
@@ -5,7 +5,7 @@ Tests for the command-line interface.
 import os
 import sys
 import tempfile
-from unittest.mock import patch, Mock
+from unittest.mock import patch
 from io import StringIO
 
 import pytest
@@ -35,12 +35,8 @@ class CaptureOutput:
         self.stderr.seek(0)
 
 
-@pytest.fixture
-def sample_python_file():
-    """Create a temporary Python file with sample documentation."""
-    with tempfile.NamedTemporaryFile(suffix=".py", delete=False) as tmp:
-        tmp.write(
-            b"""# Sample module documentation.
+# Encoded once at import; the fixture writes the bytes verbatim.
+_SAMPLE_PY_BYTES = b"""# Sample module documentation.
 # This module demonstrates the documentation format.
 
 # Sample class documentation.
@@ -53,13 +49,18 @@ class SampleClass:
 def sample_function():
     pass
 """
-        )
-        tmp_path = tmp.name
 
-    yield tmp_path
 
-    # Cleanup
-    os.unlink(tmp_path)
+@pytest.fixture(scope="session")
+def sample_python_file(tmp_path_factory):
+    """Create a temporary Python file with sample documentation.
+
+    Session-scoped: the content never changes, so the file is written
+    once for the whole run and pytest owns the cleanup.
+    """
+    file_path = tmp_path_factory.mktemp("cli") / "sample.py"
+    file_path.write_bytes(_SAMPLE_PY_BYTES)
+    return str(file_path)
 
 
 def test_parse_args():
@@ -199,14 +200,15 @@ def test_main_with_doc_style(mock_process_file, sample_python_file):
         assert kwargs["doc_style"] == style
 
 
-@patch("docu.cli.process_file")
-def test_main_exception_handling(mock_process_file, sample_python_file):
+def test_main_exception_handling(sample_python_file, monkeypatch):
     """Test that exceptions are properly handled and reported."""
     # Test different types of exceptions
     for exception in [ValueError("Test error"),
                      FileNotFoundError("File not found"),
                      TypeError("Type error")]:
-        mock_process_file.side_effect = exception
+        def boom(*args, _exc=exception, **kwargs):
+            raise _exc
+        monkeypatch.setattr("docu.cli.process_file", boom)
         with CaptureOutput() as captured:
             result = main([sample_python_file])
         assert result != 0
@@ -214,7 +216,9 @@ def test_main_exception_handling(mock_process_file, sample_python_file):
         assert str(exception) in captured.stderr.getvalue()
 
     # Test with verbose flag - should re-raise the exception
-    mock_process_file.side_effect = ValueError("Test error")
+    def boom_verbose(*args, **kwargs):
+        raise ValueError("Test error")
+    monkeypatch.setattr("docu.cli.process_file", boom_verbose)
     with pytest.raises(ValueError), CaptureOutput():
         main([sample_python_file, "--verbose"])
 
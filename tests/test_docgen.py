@@ -11,18 +11,10 @@ import pytest
 from docu.docgen import process_file
 from docu.parsers import extract_doc_comments, parse_python_file
 from docu.generators import generate_markdown_docs, generate_html_docs
-from docu.models import DocItem
 
-def create_test_file(content: str) -> str:
-    """Helper to create a temporary test file."""
-    with tempfile.NamedTemporaryFile(suffix=".py", delete=False) as tmp:
-        tmp.write(content.encode())
-        return tmp.name
-
-@pytest.fixture
-def sample_python_file():
-    """Create a temporary Python file with sample #/ documentation."""
-    content = '''#/ This is a module level documentation comment.
+# Fixture payloads as module-level bytes: encoded once at import, so
+# fixture calls write them verbatim without re-encoding.
+_SAMPLE_PY_BYTES = b'''#/ This is a module level documentation comment.
 #/ It has multiple lines.
 
 import math
@@ -50,14 +42,8 @@ class Example:
 def func(a: int, b: str = "default") -> None:
     pass
 '''
-    tmp_path = create_test_file(content)
-    yield tmp_path
-    os.unlink(tmp_path)
 
-@pytest.fixture
-def empty_python_file():
-    """Create a temporary Python file with no documentation."""
-    content = '''
+_EMPTY_PY_BYTES = b'''
 class Example:
     def method(self):
         pass
@@ -65,14 +51,43 @@ class Example:
 def func():
     pass
 '''
-    tmp_path = create_test_file(content)
-    yield tmp_path
-    os.unlink(tmp_path)
 
-def test_extract_doc_comments(sample_python_file):
+def create_test_file(tmp_dir: Path, content: bytes) -> str:
+    """Helper to create a test file; pytest owns the cleanup."""
+    file_path = tmp_dir / "sample.py"
+    file_path.write_bytes(content)
+    return str(file_path)
+
+@pytest.fixture(scope="session")
+def sample_python_file(tmp_path_factory):
+    """Create a temporary Python file with sample #/ documentation.
+
+    Session-scoped: the content is immutable, so one write serves every
+    consumer test.
+    """
+    return create_test_file(tmp_path_factory.mktemp("docgen"), _SAMPLE_PY_BYTES)
+
+@pytest.fixture(scope="session")
+def empty_python_file(tmp_path_factory):
+    """Create a temporary Python file with no documentation."""
+    return create_test_file(tmp_path_factory.mktemp("docgen"), _EMPTY_PY_BYTES)
+
+@pytest.fixture(scope="session")
+def parsed_sample(sample_python_file):
+    """Parse the sample file once and share the results.
+
+    Both parser tests assert on the same immutable input, so the file is
+    read and traversed a single time per session.
+    """
+    return {
+        "comments": extract_doc_comments(sample_python_file),
+        "doc_items": parse_python_file(sample_python_file),
+    }
+
+def test_extract_doc_comments(parsed_sample):
     """Test extraction of #/ comments from a Python file."""
-    comments = extract_doc_comments(sample_python_file)
-    
+    comments = parsed_sample["comments"]
+
     # Check number of comments and content
     assert len(comments) == 8
     assert comments[0] == (1, "This is a module level documentation comment.")
@@ -86,10 +101,10 @@ def test_extract_doc_comments(sample_python_file):
     assert any("This is the constructor" in c[1] for c in comments)
     assert any("This is a method" in c[1] for c in comments)
 
-def test_parse_python_file(sample_python_file):
+def test_parse_python_file(parsed_sample, sample_python_file):
     """Test parsing of Python file into documentation items."""
-    doc_items = parse_python_file(sample_python_file)
-    
+    doc_items = parsed_sample["doc_items"]
+
     # Module documentation
     module_name = Path(sample_python_file).stem
     assert module_name in doc_items
@@ -134,44 +149,9 @@ def test_parse_empty_file(empty_python_file):
     assert "func" in doc_items
     assert doc_items["func"].doc == ""
 
-def test_generate_markdown_docs():
+def test_generate_markdown_docs(sample_doc_items):
     """Test generation of markdown documentation."""
-    doc_items = {
-        "module": DocItem(
-            name="module",
-            doc="Module docs\nWith multiple lines",
-            item_type="module",
-            lineno=1
-        ),
-        "Class": DocItem(
-            name="Class",
-            doc="Class docs",
-            item_type="class",
-            lineno=5,
-            fields={"field1": "int", "field2": "str"},
-            methods=[
-                DocItem(
-                    name="method",
-                    doc="Method docs",
-                    item_type="method",
-                    lineno=7,
-                    parent="Class",
-                    args=[{"name": "arg1", "type_hint": "int"}],
-                    return_type="bool"
-                )
-            ]
-        ),
-        "function": DocItem(
-            name="function",
-            doc="Function docs",
-            item_type="function",
-            lineno=10,
-            args=[{"name": "param1", "type_hint": "str"}],
-            return_type="None"
-        ),
-    }
-    
-    markdown = generate_markdown_docs(doc_items)
+    markdown = generate_markdown_docs(sample_doc_items)
     
     # Check main sections
     assert "# Module module" in markdown
@@ -188,46 +168,35 @@ def test_generate_markdown_docs():
     assert "### function" in markdown
     assert "function(param1: str) -> None" in markdown
 
-def test_generate_html_docs():
+@pytest.mark.parametrize("template_name", ["default", "minimal", "modern", "rtd"])
+def test_generate_html_docs(sample_doc_items, template_name):
     """Test generation of HTML documentation."""
-    doc_items = {
-        "module": DocItem(
-            name="module",
-            doc="Module docs",
-            item_type="module",
-            lineno=1
-        ),
-    }
-    
-    html = generate_html_docs(doc_items)
-    
+    html = generate_html_docs(sample_doc_items, template_name=template_name)
+
     # Check basic HTML structure
     assert "<!DOCTYPE html>" in html
     assert "<title>" in html
     assert "Module docs" in html
-    
-    # Test with different templates
-    for template in ["default", "minimal", "modern", "rtd"]:
-        html = generate_html_docs(doc_items, template_name=template)
-        assert "Module docs" in html
 
+@pytest.mark.parametrize("template_name", ["default", "minimal", "modern", "rtd"])
+def test_process_file_html_templates(sample_python_file, template_name):
+    """Test HTML output with each bundled template."""
+    html_content = process_file(
+        sample_python_file,
+        output_format="html",
+        template_name=template_name
+    )
+    assert "<!DOCTYPE html>" in html_content
+    assert "This is a module level documentation comment" in html_content
+
+@pytest.mark.slow
 def test_process_file(sample_python_file):
     """Test end-to-end processing of a Python file."""
     # Test markdown output
     md_content = process_file(sample_python_file, output_format="markdown")
     assert "# Module" in md_content
     assert "This is a module level documentation comment" in md_content
-    
-    # Test HTML output with different templates
-    for template in ["default", "minimal", "modern", "rtd"]:
-        html_content = process_file(
-            sample_python_file,
-            output_format="html",
-            template_name=template
-        )
-        assert "<!DOCTYPE html>" in html_content
-        assert "This is a module level documentation comment" in html_content
-    
+
     # Test saving to directory
     with tempfile.TemporaryDirectory() as tmpdir:
         output_path = process_file(
@@ -254,6 +223,7 @@ def test_process_file_errors():
     with pytest.raises(ValueError):
         process_file(sample_python_file, template_name="nonexistent")
 
+@pytest.mark.slow
 def test_process_file_with_empty_file(empty_python_file):
     """Test processing a file with no documentation."""
     content = process_file(empty_python_file)
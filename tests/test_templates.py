@@ -12,9 +12,9 @@ def test_template_manager_initialization():
     assert (tm.templates_dir / 'default.html').exists()
     assert (tm.templates_dir / 'schema.json').exists()
 
-def test_template_list():
+def test_template_list(template_manager):
     """Test listing available templates."""
-    tm = TemplateManager()
+    tm = template_manager
     templates = tm.list_templates()
     
     # Verify all expected templates are present
@@ -27,9 +27,9 @@ def test_template_list():
         assert 'description' in template
         assert 'doc_style' in template
 
-def test_template_validation():
+def test_template_validation(template_manager):
     """Test template validation against schema."""
-    tm = TemplateManager()
+    tm = template_manager
     valid_template = {
         "name": "test",
         "template": "test.html",
@@ -56,9 +56,9 @@ def test_template_validation():
         }
         tm.validate_template(invalid_template)
 
-def test_template_not_found():
+def test_template_not_found(template_manager):
     """Test error handling for non-existent templates."""
-    tm = TemplateManager()
+    tm = template_manager
     with pytest.raises(ValueError, match="Template 'nonexistent' not found"):
         tm.get_template('nonexistent')
 
@@ -136,9 +136,10 @@ def test_invalid_parser_style():
     with pytest.raises(ValueError):
         get_parser('invalid_style')
 
-def test_all_template_files_exist():
+@pytest.mark.slow
+def test_all_template_files_exist(template_manager):
     """Test that all required template files exist and are valid."""
-    tm = TemplateManager()
+    tm = template_manager
     templates = tm.list_templates()
     
     for template in templates:
@@ -149,11 +150,12 @@ def test_all_template_files_exist():
         if name != 'default':
             assert (tm.templates_dir / f"{name}.json").exists()
 
-def test_template_rendering():
+@pytest.mark.slow
+@pytest.mark.parametrize("template_name", ["default", "minimal", "modern", "rtd"])
+def test_template_rendering(template_manager, template_name):
     """Test that all templates can render basic content."""
-    tm = TemplateManager()
-    templates = tm.list_templates()
-    
+    tm = template_manager
+
     # Create a method with args and return type
     method = DocItem(
         name="test_method",
@@ -182,22 +184,26 @@ def test_template_rendering():
         }]
     }
     
-    for template in templates:
-        name = template['name']
-        tmpl = tm.get_template(name)
-        rendered = tmpl.render(**test_data)
-        assert 'Test Documentation' in rendered
-        assert 'test_module' in rendered
-        assert 'TestClass' in rendered
-        assert 'test_func' in rendered
-        assert 'field1: str' in rendered
-        assert 'field2: int' in rendered
-        assert 'test_method(arg1: str) -> bool' in rendered
-        assert 'param1: int' in rendered
-
-def test_template_error_handling():
+    tmpl = tm.get_template(template_name)
+    rendered = tmpl.render(**test_data)
+    # Collect every absent needle in one pass so a failure reports the
+    # full set instead of stopping at the first missing substring.
+    needles = (
+        'Test Documentation',
+        'test_module',
+        'TestClass',
+        'test_func',
+        'field1: str',
+        'field2: int',
+        'test_method(arg1: str) -> bool',
+        'param1: int',
+    )
+    missing = [needle for needle in needles if needle not in rendered]
+    assert not missing, f"missing from {template_name} output: {missing}"
+
+def test_template_error_handling(template_manager):
     """Test template error handling."""
-    tm = TemplateManager()
+    tm = template_manager
     
     with pytest.raises(ValueError):
         # Test with missing required template variable